@@ -7,21 +7,49 @@ and writes the sorted result back to the original file or a specified output fil
 """
 
 import argparse
-import difflib
+import fnmatch
+import functools
+import hashlib
 import json
 import logging
+import os
+import pickle
 import re
 import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Pattern, Union
 
 import yaml
 
+# orjson is a much faster JSON engine; fall back to the stdlib when it is
+# not installed (it is an optional "speed" extra, not a hard dependency).
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml-backed C scanner/emitter when PyYAML was built against
+# it; they are typically 5-10x faster than the pure-Python ones for large
+# files. The constructor/representer registries and implicit-resolver tables
+# our subclasses customize live on the Python side either way.
+try:
+    from yaml import CSafeDumper as _SafeDumperBase
+    from yaml import CSafeLoader as _SafeLoaderBase
+except ImportError:
+    from yaml import SafeDumper as _SafeDumperBase
+    from yaml import SafeLoader as _SafeLoaderBase
+
 # Configure YAML to handle Norway problem correctly
 
 
-class NorwaySafeLoader(yaml.SafeLoader):
-    """Custom SafeLoader that treats off/no/n/on/yes/y as strings to avoid Norway problem."""
+class _NorwayLoaderMixin:
+    """Norway/port/glob overrides shared by both concrete loader classes.
+
+    Methods only; per-class registration (multi-constructor, resolver
+    table) happens below on the concrete classes.
+    """
 
     def construct_yaml_bool(self, node):
         """Override boolean construction to handle Norway problem."""
@@ -60,6 +88,27 @@ class NorwaySafeLoader(yaml.SafeLoader):
         return super().construct_yaml_timestamp(node)
 
 
+class NorwaySafeLoader(_NorwayLoaderMixin, _SafeLoaderBase):
+    """Custom SafeLoader that treats off/no/n/on/yes/y as strings to avoid Norway problem.
+
+    Glob scalars like ``- *.html`` are quoted by the preprocessor in
+    load_file before parsing; the ``fetch_alias`` override in the mixin
+    only takes effect when the scanner runs in Python.
+    """
+
+
+# The C scanner cannot be overridden from Python, so star-dot glob scalars
+# inside flow collections ('files: [*.html]') make it raise a malformed-alias
+# error. load_file retries such documents on this pure-Python variant, whose
+# fetch_alias override diverts them to plain scalars; everything else stays
+# on the fast C loader.
+if _SafeLoaderBase is yaml.SafeLoader:
+    _NorwayFallbackLoader = NorwaySafeLoader
+else:
+    class _NorwayFallbackLoader(_NorwayLoaderMixin, yaml.SafeLoader):
+        """Pure-Python loader used only when the C scanner rejects an alias."""
+
+
 # Add multi-constructor for unknown tags
 def unknown_tag_constructor(loader, _tag_suffix, node):
     """Handle unknown tags by treating them as strings."""
@@ -67,9 +116,13 @@ def unknown_tag_constructor(loader, _tag_suffix, node):
 
 
 NorwaySafeLoader.add_multi_constructor("!", unknown_tag_constructor)
+if _NorwayFallbackLoader is not NorwaySafeLoader:
+    _NorwayFallbackLoader.add_multi_constructor("!", unknown_tag_constructor)
 
 
-# Remove the implicit resolver for timestamps from NorwaySafeLoader for all keys, including None
+# Remove the implicit resolver for timestamps from NorwaySafeLoader for all
+# keys, including None. The resolver table is inherited from yaml's Resolver
+# class, so the fallback loader sees the same edits.
 for ch in list(NorwaySafeLoader.yaml_implicit_resolvers):
     resolvers = NorwaySafeLoader.yaml_implicit_resolvers[ch]
     NorwaySafeLoader.yaml_implicit_resolvers[ch] = [
@@ -83,9 +136,16 @@ if None in NorwaySafeLoader.yaml_implicit_resolvers:
     ]
 
 
-class NorwaySafeDumper(yaml.SafeDumper):
+# Norway-problem words, hoisted so represent_str does not rebuild the set
+# for every string it emits
+_NORWAY_WORD_SET = frozenset({"off", "no", "n", "on", "yes", "y"})
+
+
+class NorwaySafeDumper(_SafeDumperBase):
     def represent_str(self, data):
-        if data in {"off", "no", "n", "on", "yes", "y"}:
+        # The length guard lets all but the shortest strings skip the
+        # membership test; no Norway word is longer than three characters
+        if len(data) <= 3 and data in _NORWAY_WORD_SET:
             return self.represent_scalar("tag:yaml.org,2002:str", data, style="'")
         # Check if the string contains newlines and should be a block scalar
         if "\n" in data:
@@ -122,27 +182,61 @@ class FileSaveError(FileSorterError):
     """Raised when file cannot be saved."""
 
 
-def detect_file_type(file_path: str) -> str:
-    path = Path(file_path)
-    extension = path.suffix.lower()
-    if extension in [".yaml", ".yml"]:
-        return "yaml"
-    if extension == ".json":
+# Extension-to-type table with the common case spellings preseeded, so the
+# usual lookup needs no .lower() allocation
+_EXT_TYPE = {
+    ".yaml": "yaml", ".yml": "yaml", ".json": "json",
+    ".YAML": "yaml", ".YML": "yaml", ".JSON": "json",
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _sniff_file_type(file_path: str, _mtime_ns: int) -> str:
+    """Content-sniff a file with an unknown extension.
+
+    Cached on (path, mtime) so repeated lookups for the same unchanged file
+    do not reopen and reread it.
+    """
+    with Path(file_path).open(encoding="utf-8") as f:
+        content = f.read().strip()
+    if content.startswith(("{", "[")):
         return "json"
+    if content.startswith("-") or ":" in content:
+        return "yaml"
+    raise FileTypeDetectionError(
+        f"Cannot determine file type for {file_path}")
+
+
+def detect_file_type(file_path: str) -> str:
+    # splitext (not rfind) so a dotted directory name cannot fake an
+    # extension; mixed-case spellings fall back to one .lower() lookup
+    extension = os.path.splitext(file_path)[1]
+    file_type = _EXT_TYPE.get(extension) or _EXT_TYPE.get(extension.lower())
+    if file_type is not None:
+        return file_type
     try:
-        with path.open(encoding="utf-8") as f:
-            content = f.read().strip()
-        if content.startswith(("{", "[")):
-            return "json"
-        if content.startswith("-") or ":" in content:
-            return "yaml"
-        raise FileTypeDetectionError(
-            f"Cannot determine file type for {file_path}")
+        return _sniff_file_type(file_path, os.stat(file_path).st_mtime_ns)
     except Exception as err:
         raise FileTypeDetectionError(
             f"Cannot determine file type for {file_path}") from err
 
 
+def _canonical_key(value: Any) -> Optional[str]:
+    """Render value as canonical sorted JSON for multiset comparison.
+
+    Returns None for values JSON cannot represent; those few fall back to
+    pairwise structural matching.
+    """
+    try:
+        if orjson is not None:
+            return orjson.dumps(
+                value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            ).decode("utf-8")
+        return json.dumps(value, sort_keys=True, ensure_ascii=False)
+    except TypeError:
+        return None
+
+
 def validate_data_preservation(original: Any, sorted_data: Any, path: str = "root") -> List[str]:
     """
     Validate that all data structures, keys, and values are preserved after sorting.
@@ -157,6 +251,11 @@ def validate_data_preservation(original: Any, sorted_data: Any, path: str = "roo
     """
     errors = []
 
+    # Identical objects are trivially preserved (scalars are carried over
+    # by reference, so this triggers constantly during recursion)
+    if original is sorted_data:
+        return errors
+
     # Check if types match
     if type(original) is not type(sorted_data):
         errors.append(
@@ -190,6 +289,13 @@ def validate_data_preservation(original: Any, sorted_data: Any, path: str = "roo
                 f"Length mismatch at {path}: {len(original)} vs {len(sorted_data)}")
             return errors
 
+        # Fast path: flat lists compare as repr multisets in one C pass,
+        # which also catches duplicate-count changes that the set-based
+        # comparison below would miss
+        if not any(isinstance(x, (dict, list)) for x in original) and \
+                Counter(map(repr, original)) == Counter(map(repr, sorted_data)):
+            return errors
+
         # For lists, we need to check that all elements exist (order may be different)
         # Convert to sets for comparison, but handle unhashable types
         try:
@@ -206,18 +312,44 @@ def validate_data_preservation(original: Any, sorted_data: Any, path: str = "roo
                 errors.append(
                     f"Extra elements at {path}: {sorted(extra_elements)}")
         except TypeError:
-            # Handle unhashable types by comparing element by element
-            # This is less efficient but handles complex nested structures
-            original_copy = original.copy()
-            sorted_copy = sorted_data.copy()
+            # Unhashable elements (dicts/lists): compare as multisets of
+            # canonical JSON renderings, which is linear instead of the
+            # quadratic element-by-element structural matching.
+            original_counts: Counter = Counter()
+            sorted_counts: Counter = Counter()
+            original_rest = []
+            sorted_rest = []
+            for elem in original:
+                key = _canonical_key(elem)
+                if key is None:
+                    original_rest.append(elem)
+                else:
+                    original_counts[key] += 1
+            for elem in sorted_data:
+                key = _canonical_key(elem)
+                if key is None:
+                    sorted_rest.append(elem)
+                else:
+                    sorted_counts[key] += 1
+
+            missing_elements = original_counts - sorted_counts
+            extra_elements = sorted_counts - original_counts
+            if missing_elements:
+                errors.append(
+                    f"Missing elements at {path}: {sorted(missing_elements)}")
+            if extra_elements:
+                errors.append(
+                    f"Extra elements at {path}: {sorted(extra_elements)}")
 
-            for i, orig_elem in enumerate(original_copy):
+            # Elements JSON could not canonicalize keep the old pairwise
+            # structural matching; in practice parser output never lands here
+            for i, orig_elem in enumerate(original_rest):
                 found_match = False
-                for j, sorted_elem in enumerate(sorted_copy):
+                for j, sorted_elem in enumerate(sorted_rest):
                     elem_errors = validate_data_preservation(
                         orig_elem, sorted_elem, f"{path}[{i}]")
                     if not elem_errors:
-                        sorted_copy.pop(j)
+                        sorted_rest.pop(j)
                         found_match = True
                         break
 
@@ -233,92 +365,428 @@ def validate_data_preservation(original: Any, sorted_data: Any, path: str = "roo
     return errors
 
 
-def sort_dict_recursively(data: Any, *, sort_arrays_by_first_key: bool = False) -> Any:
-    if isinstance(data, dict):
-        return {k: sort_dict_recursively(v, sort_arrays_by_first_key=sort_arrays_by_first_key) for k, v in sorted(data.items(), key=lambda x: str(x[0]))}
-    if isinstance(data, list):
-        if all(isinstance(item, (str, int, float, bool)) or item is None for item in data):
-            # Sort arrays of primitives
-            return sorted(data, key=lambda x: (x is None, str(x) if x is not None else ""))
-        # For arrays of objects, optionally sort by the first key's value, then recursively sort each object
-        if sort_arrays_by_first_key and all(isinstance(item, dict) and item for item in data):
-            # Get the first key from each dict and sort by its value BEFORE sorting keys within objects
-            first_keys = [next(iter(item.keys())) for item in data]
-            # Use the first key that appears in all items, or the first key of the first item
-            if first_keys and all(k == first_keys[0] for k in first_keys):
-                sort_key = first_keys[0]
-                # Sort the array by the first key's value
-                sorted_array = sorted(data, key=lambda x: (
-                    x[sort_key] is None, str(x[sort_key]) if x[sort_key] is not None else ""))
-                # Then recursively sort each object's keys
-                return [sort_dict_recursively(item, sort_arrays_by_first_key=sort_arrays_by_first_key) for item in sorted_array]
-        # If not sorting by first key or not all items are dicts with the same first key, just recursively sort each item
-        return [sort_dict_recursively(item, sort_arrays_by_first_key=sort_arrays_by_first_key) for item in data]
+# Exact scalar types produced by the JSON/YAML parsers; checked via type()
+# set membership, which is cheaper than chained isinstance calls.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _sort_scalar_list(data: list) -> list:
+    """Sort a list of scalars, with a key-free fast path for all-string lists."""
+    if all(type(item) is str for item in data):
+        # Equivalent to the generic key below but avoids a lambda call per item
+        return sorted(data)
+    # Decorate-sort-undecorate: build (is_none, str_key, index) tuples in one
+    # pass and let the C sort compare them directly, instead of invoking a
+    # lambda key per element. The index both breaks ties stably and avoids
+    # comparing unorderable raw values (e.g. 1 vs "1").
+    decorated = sorted(
+        (item is None, "" if item is None else str(item), i)
+        for i, item in enumerate(data)
+    )
+    return [data[i] for _, _, i in decorated]
+
+
+def _order_list(data: list, *, sort_arrays_by_first_key: bool, all_dicts: bool) -> list:
+    """Pick the element order for a non-scalar list before its items are sorted.
+
+    all_dicts is precomputed by the caller's classification pass so the list
+    is not walked a second time here.
+    """
+    # For arrays of objects, optionally sort by the first key's value BEFORE
+    # sorting keys within objects
+    if sort_arrays_by_first_key and all_dicts:
+        first_keys = [next(iter(item.keys())) for item in data]
+        # Use the first key only when it is shared by every item
+        if first_keys and all(k == first_keys[0] for k in first_keys):
+            sort_key = first_keys[0]
+            return sorted(data, key=lambda x: (
+                x[sort_key] is None, str(x[sort_key]) if x[sort_key] is not None else ""))
     return data
 
 
-def load_file(file_path: str, file_type: str) -> Any:
-    def quote_port_and_specials(yaml_text: str) -> str:
-        # Only quote if not already quoted (not surrounded by single or double quotes)
-        # 1. Port mappings in sequences: - 22:22
-        yaml_text = re.sub(r"^([ \t]*-[ \t]*)(?!['\"])(\d{1,5}:\d{1,5})(?!['\"])([ \t]*)(#.*)?$",
-                           lambda m: f"{m.group(1)}'{m.group(2)}'{m.group(3) or ''}{m.group(4) or ''}",
-                           yaml_text, flags=re.MULTILINE)
-        # 2. !something in sequences: - !.git
-        yaml_text = re.sub(r"^([ \t]*-[ \t]*)(?!['\"])(!\S+)(?!['\"])([ \t]*)(#.*)?$",
-                           lambda m: f"{m.group(1)}'{m.group(2)}'{m.group(3) or ''}{m.group(4) or ''}",
-                           yaml_text, flags=re.MULTILINE)
-        # 3. Norway-problem values in sequences: - off, - no, - n, - on, - yes, - y
-        np_words = r"(off|no|n|on|yes|y)"
-        yaml_text = re.sub(rf"^([ \t]*-[ \t]*)(?<!['\"])(?P<val>{np_words})(?!['\"])([ \t]*)(#.*)?$",
-                           lambda m: f"{m.group(1)}'{m.group('val')}'{m.group(4) or ''}{m.group(5) or ''}",
-                           yaml_text, flags=re.MULTILINE)
-        # 4. Norway-problem values in mappings: key: off
-        return re.sub(rf"^([ \t]*[\w\-]+:[ \t]*)(?<!['\"])(?P<val>{np_words})(?!['\"])([ \t]*)(#.*)?$",
-                      lambda m: f"{m.group(1)}'{m.group('val')}'{m.group(4) or ''}{m.group(5) or ''}",
-                      yaml_text, flags=re.MULTILINE)
+def sort_dict_recursively(data: Any, *, sort_arrays_by_first_key: bool = False) -> Any:
+    if not isinstance(data, (dict, list)):
+        return data
+    # Explicit-stack post-order traversal: each entry writes its sorted copy
+    # into (parent, slot). This avoids Python call overhead per node and
+    # cannot hit RecursionError on deeply nested documents.
+    root: List[Any] = [None]
+    stack = [(data, root, 0)]
+    # Bind hot names to locals; the traversal loop is pure interpreter
+    # traffic and repeated global/attribute lookups are measurable on
+    # structure-heavy documents.
+    stack_pop = stack.pop
+    stack_append = stack.append
+    scalar_types = _SCALAR_TYPES
+    # Memoize per call on object identity: subtrees shared via YAML anchors
+    # arrive here as the same object, so they are sorted once and the
+    # sharing topology survives into the output.
+    memo: dict = {}
+    while stack:
+        node, parent, slot = stack_pop()
+        node_id = id(node)
+        cached = memo.get(node_id)
+        if cached is not None:
+            parent[slot] = cached
+            continue
+        if isinstance(node, dict):
+            if all(type(k) is str for k in node):
+                # Keys are unique, so item tuples never tie on the key and
+                # the values are never compared; sorting without a key
+                # function keeps the comparison entirely in C.
+                items = sorted(node.items())
+            else:
+                # Decorate-sort-undecorate so str() runs once per key
+                # instead of once per comparison; the index tie-break keeps
+                # equal string forms (e.g. 1 vs "1") from comparing values.
+                decorated = sorted(
+                    (str(k), i, k, v) for i, (k, v) in enumerate(node.items())
+                )
+                items = [(k, v) for _, _, k, v in decorated]
+            # Bulk-build via the C constructor with keys already in sorted
+            # order; container values are overwritten in place once their
+            # own sorted copies are ready, which keeps the insertion order.
+            new_dict = dict(items)
+            children = [(v, new_dict, k)
+                        for k, v in items if isinstance(v, (dict, list))]
+            if not children and list(new_dict) == list(node):
+                # Leaf dict already in sorted order: hand back the input
+                # object so validation can skip the subtree on identity.
+                # Interior nodes cannot share, as their children are only
+                # sorted after the parent slot is written.
+                parent[slot] = memo[node_id] = node
+            else:
+                parent[slot] = memo[node_id] = new_dict
+                for child in children:
+                    stack_append(child)
+        elif isinstance(node, list):
+            # Classify in a single pass with early exit: all-scalar lists go
+            # to the fast sort, and the all-dicts answer _order_list needs
+            # is collected along the way instead of in a second walk.
+            all_scalars = True
+            all_dicts = True
+            for item in node:
+                if type(item) in scalar_types:
+                    all_dicts = False
+                elif type(item) is dict and item:
+                    all_scalars = False
+                else:
+                    all_scalars = all_dicts = False
+                    break
+            if all_scalars:
+                # Sort arrays of primitives; an already-ordered list keeps
+                # its identity for the same validation short-circuit. The
+                # comparison must be per-element identity, not ==, which
+                # treats False == 0 and 1 == 1.0 as equal and would keep
+                # mixed bool/number lists in input order instead of the
+                # canonical sorted order.
+                sorted_list = _sort_scalar_list(node)
+                parent[slot] = memo[node_id] = (
+                    node if all(new is old for new, old in zip(sorted_list, node))
+                    else sorted_list)
+            else:
+                ordered = _order_list(
+                    node, sort_arrays_by_first_key=sort_arrays_by_first_key,
+                    all_dicts=all_dicts)
+                new_list: List[Any] = [None] * len(ordered)
+                parent[slot] = memo[node_id] = new_list
+                for i, item in enumerate(ordered):
+                    if isinstance(item, (dict, list)):
+                        stack_append((item, new_list, i))
+                    else:
+                        new_list[i] = item
+        else:
+            parent[slot] = node
+    return root[0]
+
+
+# One compiled alternation replaces the former per-call re.sub passes over
+# the whole document. Only quote if not already quoted (not surrounded by
+# single or double quotes). The three branches keep their original scopes:
+#   - sequence items: port mappings (22:22), !tags, glob scalars (*.html)
+#     and Norway-problem words
+#   - mapping values: Norway-problem words only (a mapping port value like
+#     'key: 22:22' must keep its YAML 1.1 sexagesimal reading)
+#   - mapping values: glob scalars, which need at least one space after ':'
+_NORWAY_WORDS = r"off|no|n|on|yes|y"
+_YAML_SPECIALS_RE = re.compile(
+    r"^(?:"
+    rf"(?P<sprefix>[ \t]*-[ \t]*)(?!['\"])(?P<sval>\d{{1,5}}:\d{{1,5}}|!\S+|\*\.\S+|{_NORWAY_WORDS})"
+    r"|"
+    rf"(?P<mprefix>[ \t]*[\w\-]+:[ \t]*)(?!['\"])(?P<mval>{_NORWAY_WORDS})"
+    r"|"
+    r"(?P<gprefix>[ \t]*[\w\-]+:[ \t]+)(?!['\"])(?P<gval>\*\.\S+)"
+    r")"
+    r"(?!['\"])(?P<tail>[ \t]*)(?P<comment>#.*)?$",
+    re.MULTILINE,
+)
+
+
+# Cheap pre-scan: every line the full alternation could rewrite contains a
+# tag/alias marker, a digit:digit pair, or a bare Norway word. Documents
+# without any of these (the common case) skip the anchored pass entirely.
+_SPECIALS_HINT_RE = re.compile(r"[!*]|\d:\d|\b(?:off|no|n|on|yes|y)\b")
+
+
+def _quote_specials_match(m: "re.Match") -> str:
+    prefix = m.group("sprefix") or m.group("mprefix") or m.group("gprefix")
+    value = m.group("sval") or m.group("mval") or m.group("gval")
+    return f"{prefix}'{value}'{m.group('tail') or ''}{m.group('comment') or ''}"
+
+
+def quote_port_and_specials(yaml_text: str) -> str:
+    """Quote unquoted port mappings, tags, globs and Norway-problem values."""
+    if _SPECIALS_HINT_RE.search(yaml_text) is None:
+        return yaml_text
+    return _YAML_SPECIALS_RE.sub(_quote_specials_match, yaml_text)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_file_cached(file_path: str, file_type: str, _mtime_ns: int, _size: int) -> Any:
+    """load_file memoized on the file's stat identity.
+
+    The mtime/size arguments only serve as cache-key components: touching
+    the file produces a new key, so stale entries are never returned and
+    simply age out of the LRU.
+    """
+    return load_file(file_path, file_type)
+
+
+def load_file(file_path: str, file_type: str, raw: Optional[bytes] = None) -> Any:
     try:
-        with Path(file_path).open(encoding="utf-8") as f:
-            content = f.read()
-            if not content.strip():
-                raise FileLoadError(f"File is empty: {file_path}")
-            f.seek(0)
-            if file_type == "json":
-                return json.load(f)
-            if file_type == "yaml":
-                # Preprocess to quote unquoted port mappings, !something, and Norway-problem values
-                content = quote_port_and_specials(content)
-                # nosec
+        path = Path(file_path)
+        if raw is None:
+            # Read raw bytes in one syscall-friendly pass; decode once only
+            # when the parser needs str (json.loads consumes bytes directly).
+            raw = path.read_bytes()
+        if not raw.strip():
+            raise FileLoadError(f"File is empty: {file_path}")
+        if file_type == "json":
+            # Parsing stays on the stdlib even when orjson is installed:
+            # orjson.loads silently converts ints outside the 64-bit range
+            # to floats, corrupting data before --validate could see it.
+            # orjson is still used on the dump side, where its big-int
+            # TypeError falls back to the stdlib instead.
+            return json.loads(raw)
+        if file_type == "yaml":
+            # Preprocess to quote unquoted port mappings, !something, and Norway-problem values
+            content = quote_port_and_specials(raw.decode("utf-8"))
+            # nosec
+            try:
                 docs = list(yaml.load_all(content, Loader=NorwaySafeLoader))
-                if len(docs) == 1:
-                    return docs[0]
-                return docs
+            except yaml.YAMLError as yerr:
+                # Star-dot glob scalars in flow collections ('[*.html]')
+                # read as malformed aliases to the C scanner, and the
+                # line-anchored preprocessor cannot quote them there
+                # without risking rewrites inside quoted scalars. Retry on
+                # the pure-Python loader, whose fetch_alias override
+                # diverts them to plain scalars.
+                if _NorwayFallbackLoader is NorwaySafeLoader or "alias" not in str(yerr):
+                    raise
+                docs = list(yaml.load_all(content, Loader=_NorwayFallbackLoader))
+            if len(docs) == 1:
+                return docs[0]
+            return docs
     except Exception as err:
         raise FileLoadError(
             f"Error loading {file_type.upper()} file: {err}") from err
 
 
+def _dumps_json(data: Any, json_indent: int = 2) -> str:
+    """Serialize data to a sorted JSON string, using orjson when it can match the requested format."""
+    # Caveat: orjson renders some floats shorter than the stdlib ('1e30'
+    # vs '1e+30'), so --check verdicts on float-heavy files are only
+    # stable within one environment (with or without the speed extra).
+    if orjson is not None and json_indent == 2:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode("utf-8")
+        except TypeError:
+            # orjson rejects some values the stdlib accepts (e.g. big ints)
+            pass
+    return json.dumps(data, indent=json_indent,
+                      ensure_ascii=False, sort_keys=True)
+
+
+def _render_sorted(sorted_data: Any, file_type: str, json_indent: int = 2, yaml_indent: int = 2) -> str:
+    """Render sorted data exactly as save_file would write it.
+
+    Shared by save_file and check mode so a file written by ordnung always
+    passes a subsequent --check with the same options.
+    """
+    if file_type == "json":
+        return _dumps_json(sorted_data, json_indent)
+    if _is_multi_doc(sorted_data):
+        return yaml.dump_all(sorted_data, default_flow_style=False,
+                             allow_unicode=True, sort_keys=True, indent=yaml_indent, Dumper=NorwaySafeDumper, explicit_start=True)
+    return yaml.dump(sorted_data, default_flow_style=False,
+                     allow_unicode=True, sort_keys=True, indent=yaml_indent, Dumper=NorwaySafeDumper)
+
+
+def _is_multi_doc(sorted_data: Any) -> bool:
+    # Multiple YAML documents are dumped with dump_all; a single list-valued
+    # document must not be, or it would gain a spurious --- separator.
+    return isinstance(sorted_data, list) and (
+        len(sorted_data) > 1
+        or (len(sorted_data) == 1 and not isinstance(sorted_data[0], list))
+    )
+
+
+class _StreamMismatch(Exception):
+    """Raised by _ComparingStream on the first diverging dump chunk."""
+
+
+class _ComparingStream:
+    """Write target that checks dumper output against expected text.
+
+    Mirrors the stripped-string comparison used by check mode: leading
+    whitespace from the dump and anything written past the expected text
+    must be whitespace. Raising on the first divergence lets the dumper
+    stop without serializing the rest of the document.
+    """
+
+    def __init__(self, expected: str) -> None:
+        self._expected = expected
+        self._pos = 0
+        self._at_start = True
+
+    def write(self, chunk: str) -> None:
+        if self._at_start:
+            chunk = chunk.lstrip()
+            if not chunk:
+                return
+            self._at_start = False
+        expected = self._expected
+        end = self._pos + len(chunk)
+        if end > len(expected):
+            within = len(expected) - self._pos
+            if chunk[:within] != expected[self._pos:] or chunk[within:].strip():
+                raise _StreamMismatch
+            self._pos = len(expected)
+        elif chunk != expected[self._pos:end]:
+            raise _StreamMismatch
+        else:
+            self._pos = end
+
+    def matched(self) -> bool:
+        return self._pos == len(self._expected)
+
+
+def _yaml_check_matches(original_content: str, sorted_data: Any, yaml_indent: int) -> bool:
+    """Return True if dumping sorted_data reproduces the (stripped) original."""
+    stream = _ComparingStream(original_content)
+    try:
+        if _is_multi_doc(sorted_data):
+            yaml.dump_all(sorted_data, stream, default_flow_style=False,
+                          allow_unicode=True, sort_keys=True, indent=yaml_indent,
+                          Dumper=NorwaySafeDumper, explicit_start=True)
+        else:
+            yaml.dump(sorted_data, stream, default_flow_style=False,
+                      allow_unicode=True, sort_keys=True, indent=yaml_indent,
+                      Dumper=NorwaySafeDumper)
+    except _StreamMismatch:
+        return False
+    return stream.matched()
+
+
 def save_file(data: Any, file_path: str, file_type: str, json_indent: int = 2, yaml_indent: int = 2) -> None:
     try:
-        with Path(file_path).open("w", encoding="utf-8") as f:
-            if file_type == "json":
-                json.dump(data, f, indent=json_indent,
-                          ensure_ascii=False, sort_keys=True)
-            elif file_type == "yaml":
-                # Support multiple YAML documents
-                # Avoid writing a single YAML doc containing a list of docs
-                if isinstance(data, list) and (len(data) > 1 or (len(data) == 1 and not isinstance(data[0], list))):
-                    yaml.dump_all(data, f, default_flow_style=False,
-                                  allow_unicode=True, sort_keys=True, indent=yaml_indent, Dumper=NorwaySafeDumper, explicit_start=True)
-                else:
-                    yaml.dump(data, f, default_flow_style=False,
-                              allow_unicode=True, sort_keys=True, indent=yaml_indent, Dumper=NorwaySafeDumper)
+        # Encode once and write in a single call instead of streaming through
+        # the text-mode codec/newline layer. Writing to a sibling temp file
+        # and renaming keeps a crash mid-write from corrupting the original.
+        rendered = _render_sorted(data, file_type, json_indent, yaml_indent)
+        tmp_path = Path(f"{file_path}.tmp.{os.getpid()}")
+        try:
+            tmp_path.write_bytes(rendered.encode("utf-8"))
+            os.replace(tmp_path, file_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
     except Exception as err:
         raise FileSaveError(
             f"Error saving {file_type.upper()} file: {err}") from err
 
 
-def sort_file(input_file: str, output_file: Optional[str] = None, *, json_indent: int = 2, yaml_indent: int = 2, check: bool = False, sort_arrays_by_first_key: bool = False, sort_docs_by_first_key: bool = False, validate: bool = False) -> bool:
+# Manifest of content hashes for files that last passed --check, so warm
+# CI runs can skip parsing entirely (used only together with --cache)
+_HASH_MANIFEST_NAME = ".ordnung-hashes.json"
+
+
+def _read_hash_manifest() -> dict:
+    try:
+        manifest = json.loads(Path(_HASH_MANIFEST_NAME).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _update_hash_manifest(entry_key: str, content_sig: str) -> None:
+    """Merge one entry into the manifest; failures are non-fatal.
+
+    Re-reading before writing keeps concurrent workers from discarding each
+    other's entries (a lost entry only costs a future cache miss).
+    """
+    manifest = _read_hash_manifest()
+    manifest[entry_key] = content_sig
+    tmp_path = Path(_HASH_MANIFEST_NAME + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        os.replace(tmp_path, _HASH_MANIFEST_NAME)
+    except OSError:
+        logger.debug("Could not write hash manifest")
+
+
+# Sorted-result caches live together under the user's cache home (keyed by
+# a hash of the absolute source path), never inside the tree being sorted:
+# unpickling executes code, and the entry names are predictable, so a cache
+# directory resolved from the working directory would let a poisoned
+# sidecar committed into a checkout run on the next 'ordnung --cache'.
+# XDG_CACHE_HOME / ~/.cache are user-owned, so everything read from there
+# was written by the user's own runs.
+_CACHE_DIR_NAME = "ordnung"
+
+
+def _sort_cache_dir() -> Path:
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / _CACHE_DIR_NAME
+
+
+def _sort_cache_path(input_file: str) -> Path:
+    abs_path = os.path.normpath(os.path.abspath(input_file))
+    digest = hashlib.blake2b(abs_path.encode("utf-8"),
+                             digest_size=16).hexdigest()
+    return _sort_cache_dir() / f"{digest}.pkl"
+
+
+def _read_sort_cache(cache_path: Path, cache_key: tuple) -> Any:
+    """Return the cached sorted structure, or None on any miss/mismatch."""
+    try:
+        with cache_path.open("rb") as f:
+            key, payload = pickle.load(f)  # nosec - read from the user's own cache home only
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        return None
+    if key != cache_key:
+        return None
+    return payload
+
+
+def _write_sort_cache(cache_path: Path, cache_key: tuple, sorted_data: Any) -> None:
+    """Atomically write the sort-cache sidecar; failures are non-fatal."""
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as f:
+            pickle.dump((cache_key, sorted_data), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        logger.debug("Could not write cache sidecar: %s", cache_path)
+
+
+def sort_file(input_file: str, output_file: Optional[str] = None, *, json_indent: int = 2, yaml_indent: int = 2, check: bool = False, sort_arrays_by_first_key: bool = False, sort_docs_by_first_key: bool = False, validate: bool = False, cache: bool = False) -> bool:
     """
     Sort a JSON or YAML file. For YAML, can sort arrays by first key and (if multi-doc) sort docs by first key value.
     Args:
@@ -330,77 +798,136 @@ def sort_file(input_file: str, output_file: Optional[str] = None, *, json_indent
         sort_arrays_by_first_key: If True, sort arrays of objects by their first key value.
         sort_docs_by_first_key: If True and YAML multi-doc, sort docs by the value of their first key.
         validate: If True, validate that all data structures are preserved after sorting.
+        cache: If True, reuse the sorted structure from a sidecar cache when the file is unchanged.
     Returns:
         True if file is already formatted (in check mode), else True if write succeeds.
     """
-    if not Path(input_file).exists():
-        raise FileNotFoundError(f"Input file not found: {input_file}")
+    # One Path and one stat serve the existence check, the cache key and
+    # the read, instead of a fresh Path construction and syscall per use
+    input_path = Path(input_file)
+    try:
+        stat_result = input_path.stat()
+    except FileNotFoundError as err:
+        raise FileNotFoundError(
+            f"Input file not found: {input_file}") from err
     file_type = detect_file_type(input_file)
     logger.info("Detected file type: %s", file_type.upper())
-    data = load_file(input_file, file_type)
-    logger.info("Loaded data from: %s", input_file)
-    # If YAML multi-doc: sort each doc separately
-    if file_type == "yaml" and isinstance(data, list) and any(isinstance(doc, (dict, list, type(None))) for doc in data):
-        sorted_docs = [sort_dict_recursively(
-            doc, sort_arrays_by_first_key=sort_arrays_by_first_key) for doc in data]
-        if sort_docs_by_first_key:
-            # Only sort docs that are dicts and have at least one key
-
-            def doc_sort_key(doc):
-                if isinstance(doc, dict) and doc:
-                    first_key = next(iter(doc.keys()))
-                    value = doc[first_key]
-                    # Sort by (type_name, string_value) for robust, user-explained order
-                    return (str(type(value)), str(value))
-                # None or non-dict docs sort last
-                return chr(0x10FFFF)
-            sorted_data = sorted(sorted_docs, key=doc_sort_key)
+
+    # Hash short-circuit for --check --cache: a file whose content (and
+    # options) match its entry from a previous successful check is known to
+    # be formatted without any parsing or sorting.
+    # Check mode needs the original text for the comparison anyway, so read
+    # the file exactly once and reuse the bytes for the hash manifest, the
+    # parse, and the comparison instead of reopening it for each.
+    raw = input_path.read_bytes() if check else None
+
+    entry_key = content_sig = None
+    if check and cache:
+        digest = hashlib.blake2b(raw).hexdigest()
+        content_sig = f"{digest}:{file_type}:{json_indent}:{yaml_indent}:{int(sort_arrays_by_first_key)}:{int(sort_docs_by_first_key)}"
+        entry_key = os.path.normpath(os.path.abspath(input_file))
+        if _read_hash_manifest().get(entry_key) == content_sig:
+            logger.info(
+                "File unchanged since last successful check: %s", input_file)
+            return True
+
+    # Opt-in sidecar cache: skip parse+sort entirely when the file and the
+    # sort options are unchanged. Validation needs the original data, so it
+    # always takes the full path.
+    cache_path = _sort_cache_path(input_file) if cache else None
+    cache_key = (stat_result.st_mtime_ns, stat_result.st_size,
+                 sort_arrays_by_first_key, sort_docs_by_first_key)
+    sorted_data = None
+    if cache_path is not None and not validate:
+        sorted_data = _read_sort_cache(cache_path, cache_key)
+        if sorted_data is not None:
+            logger.info("Using cached sorted data for: %s", input_file)
+
+    if sorted_data is None:
+        if raw is not None:
+            data = load_file(input_file, file_type, raw=raw)
         else:
-            sorted_data = sorted_docs
-    else:
-        sorted_data = sort_dict_recursively(
-            data, sort_arrays_by_first_key=sort_arrays_by_first_key)
-    logger.info("Data sorted successfully")
-
-    # Validate data preservation if requested
-    if validate:
-        logger.info("Validating data preservation...")
-        validation_errors = validate_data_preservation(data, sorted_data)
-        if validation_errors:
-            logger.error(
-                "Data validation failed! The following issues were found:")
-            for error in validation_errors:
-                logger.error("  %s", error)
-            raise FileSorterError(
-                "Data validation failed - data structures were not preserved during sorting")
-        logger.info("Data validation passed - all structures preserved")
+            data = _load_file_cached(
+                input_file, file_type, stat_result.st_mtime_ns, stat_result.st_size)
+        logger.info("Loaded data from: %s", input_file)
+        # If YAML multi-doc: sort each doc separately
+        if file_type == "yaml" and isinstance(data, list) and any(isinstance(doc, (dict, list, type(None))) for doc in data):
+            sorted_docs = [sort_dict_recursively(
+                doc, sort_arrays_by_first_key=sort_arrays_by_first_key) for doc in data]
+            if sort_docs_by_first_key:
+                # Only sort docs that are dicts and have at least one key
+
+                def doc_sort_key(doc):
+                    if isinstance(doc, dict) and doc:
+                        first_key = next(iter(doc.keys()))
+                        value = doc[first_key]
+                        # Sort by (type_name, string_value) for robust, user-explained order
+                        return (str(type(value)), str(value))
+                    # None or non-dict docs sort last
+                    return chr(0x10FFFF)
+                sorted_data = sorted(sorted_docs, key=doc_sort_key)
+            else:
+                sorted_data = sorted_docs
+        else:
+            sorted_data = sort_dict_recursively(
+                data, sort_arrays_by_first_key=sort_arrays_by_first_key)
+        logger.info("Data sorted successfully")
+
+        # Validate data preservation if requested
+        if validate:
+            logger.info("Validating data preservation...")
+            validation_errors = validate_data_preservation(data, sorted_data)
+            if validation_errors:
+                logger.error(
+                    "Data validation failed! The following issues were found:")
+                for error in validation_errors:
+                    logger.error("  %s", error)
+                raise FileSorterError(
+                    "Data validation failed - data structures were not preserved during sorting")
+            logger.info("Data validation passed - all structures preserved")
+
+        # An in-place write is re-keyed after save_file below instead: the
+        # rename there bumps the source mtime, so an entry keyed on the
+        # pre-save stat could never hit again.
+        if cache_path is not None and (
+            check or (output_file is not None and Path(output_file) != input_path)
+        ):
+            _write_sort_cache(cache_path, cache_key, sorted_data)
 
     if check:
-        # Check mode: compare sorted output to file content
-        with Path(input_file).open(encoding="utf-8") as f:
-            original_content = f.read().strip()
-        if file_type == "json":
-            formatted = json.dumps(
-                sorted_data, indent=json_indent, ensure_ascii=False, sort_keys=True)
-        # For multi-doc YAML, use dump_all
-        elif isinstance(sorted_data, list) and any(isinstance(doc, (dict, list, type(None))) for doc in sorted_data):
-            formatted = yaml.dump_all(sorted_data, default_flow_style=False,
-                                      allow_unicode=True, sort_keys=True, indent=yaml_indent).strip()
+        # Check mode: compare sorted output to the file content read above;
+        # newline translation mirrors what text-mode reading used to do
+        original_content = raw.decode("utf-8").replace(
+            "\r\n", "\n").replace("\r", "\n").strip()
+        if file_type == "yaml":
+            # Stream the dump against the original so a failed check stops
+            # serializing at the first diverging chunk instead of always
+            # materializing a second full copy of the document.
+            matches = _yaml_check_matches(
+                original_content, sorted_data, yaml_indent)
         else:
-            formatted = yaml.dump(sorted_data, default_flow_style=False,
-                                  allow_unicode=True, sort_keys=True, indent=yaml_indent).strip()
-        if original_content != formatted:
+            matches = original_content == _render_sorted(
+                sorted_data, file_type, json_indent, yaml_indent).strip()
+        if not matches:
             logger.warning("File is not formatted: %s", input_file)
-            diff = difflib.unified_diff(
-                original_content.splitlines(),
-                formatted.splitlines(),
-                fromfile="original",
-                tofile="sorted",
-                lineterm="",
-            )
-            logger.info("\n".join(diff))
+            # Building the unified diff is by far the most expensive part of a
+            # failed check; skip it entirely when its output would be discarded.
+            if logger.isEnabledFor(logging.INFO):
+                import difflib  # deferred: only failed checks need it
+                formatted = _render_sorted(
+                    sorted_data, file_type, json_indent, yaml_indent).strip()
+                diff = difflib.unified_diff(
+                    original_content.splitlines(),
+                    formatted.splitlines(),
+                    fromfile="original",
+                    tofile="sorted",
+                    lineterm="",
+                )
+                logger.info("\n".join(diff))
             return False
         logger.info("File is already formatted: %s", input_file)
+        if entry_key is not None:
+            _update_hash_manifest(entry_key, content_sig)
         return True
     # Normal mode: write output
     if output_file is None:
@@ -410,95 +937,199 @@ def sort_file(input_file: str, output_file: Optional[str] = None, *, json_indent
         logger.info("Writing sorted data to: %s", output_file)
     save_file(sorted_data, output_file, file_type, json_indent, yaml_indent)
     logger.info("File saved successfully!")
+    if cache_path is not None and Path(output_file) == input_path:
+        # Key the cache entry against the freshly written file so the next
+        # run over the now-sorted file can reuse the structure.
+        try:
+            new_stat = input_path.stat()
+        except OSError:
+            logger.debug("Could not re-stat for the sort cache: %s", input_file)
+        else:
+            _write_sort_cache(
+                cache_path,
+                (new_stat.st_mtime_ns, new_stat.st_size,
+                 sort_arrays_by_first_key, sort_docs_by_first_key),
+                sorted_data)
     return True
 
 
-def _should_exclude_file(file_path: Path, exclude_patterns: Optional[List[str]]) -> bool:
-    """
-    Check if a file should be excluded based on the exclude patterns.
-    Supports both glob patterns and regex patterns.
+def _compile_exclude_patterns(
+    exclude_patterns: Optional[List[str]],
+) -> List[tuple]:
+    """Precompile exclude patterns into (pattern, glob_ok, glob_re, regex) tuples.
+
+    Compiling once up front replaces a per-file re.compile of every pattern,
+    and probing Path.match here moves its ValueError handling out of the
+    per-file loop. glob_re holds a compiled basename matcher for
+    separator-free globs (None otherwise, leaving Path.match to handle the
+    pattern). A pattern that is not a valid regex keeps regex as None and
+    falls back to literal substring matching, exactly as the per-file path
+    did.
     """
-    if not exclude_patterns:
+    return [_compile_exclude(pattern) for pattern in exclude_patterns or []]
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_exclude(pattern: str) -> tuple:
+    """Compile one exclude pattern, memoized so repeated calls with the same
+    pattern set (one per processed file in main's loop) reuse the result."""
+    try:
+        Path("_probe_").match(pattern)
+        glob_ok = True
+    except (ValueError, TypeError):
+        glob_ok = False
+    # Separator-free globs match the basename only, exactly like Path.match,
+    # so they can be translated and compiled here once instead of letting
+    # Path.match re-translate the pattern for every file
+    glob_re = None
+    if glob_ok and "/" not in pattern and os.sep not in pattern:
+        # Windows path matching is case-insensitive; mirror Path.match
+        flags = re.IGNORECASE if os.name == "nt" else 0
+        glob_re = re.compile(fnmatch.translate(pattern), flags)
+    try:
+        regex = re.compile(pattern)
+    except re.error:
+        regex = None
+    return (pattern, glob_ok, glob_re, regex)
+
+
+def _matches_excludes(file_path: Path, compiled_excludes: List[tuple]) -> bool:
+    """Check file_path against patterns precompiled by _compile_exclude_patterns."""
+    if not compiled_excludes:
         return False
 
     file_str = str(file_path)
     file_name = file_path.name
 
-    for pattern in exclude_patterns:
-        # Try glob pattern matching first
-        try:
-            if file_path.match(pattern):
+    # Globs and regexes are deliberately both tried per pattern (an exclude
+    # like 'test.*' is meaningful under either reading), so this stays a
+    # union of checks rather than a dispatch on pattern shape.
+    for pattern, glob_ok, glob_re, regex in compiled_excludes:
+        if glob_re is not None:
+            if glob_re.match(file_name):
                 return True
-        except (ValueError, TypeError):
-            # If glob matching fails, try regex
-            pass
-
-        # Try regex pattern matching
-        try:
-            if re.search(pattern, file_str) or re.search(pattern, file_name):
-                return True
-        except re.error:
-            # If regex is invalid, treat as literal string match
-            if pattern in file_str or pattern in file_name:
+        elif glob_ok and file_path.match(pattern):
+            return True
+        if regex is not None:
+            if regex.search(file_str) or regex.search(file_name):
                 return True
+        # If regex is invalid, treat as literal string match
+        elif pattern in file_str or pattern in file_name:
+            return True
 
     return False
 
 
+def _should_exclude_file(file_path: Path, exclude_patterns: Optional[List[str]]) -> bool:
+    """
+    Check if a file should be excluded based on the exclude patterns.
+    Supports both glob patterns and regex patterns.
+    """
+    return _matches_excludes(file_path, _compile_exclude_patterns(exclude_patterns))
+
+
+# Supported file extensions, as a tuple so str.endswith can take it directly
+_SUPPORTED_EXTS = (".json", ".yaml", ".yml")
+
+
+def _iter_supported_files(root: Path, *, recursive: bool = False):
+    """Yield paths (str) of supported files under root in a single os.scandir walk.
+
+    One pass replaces the three per-extension glob walks, and DirEntry type
+    checks reuse the stat data scandir already fetched.
+    """
+    dirs = deque([str(root)])
+    while dirs:
+        current = dirs.popleft()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            dirs.append(entry.path)
+                    elif entry.is_file() and entry.name.lower().endswith(_SUPPORTED_EXTS):
+                        yield entry.path
+        except OSError:
+            # Unreadable directory: match glob's behavior and skip it
+            continue
+
+
+def _iter_pattern_matches(path: Path, *, recursive: bool = False):
+    """Yield supported files whose names match the glob pattern in path.name.
+
+    The pattern is compiled once via fnmatch.translate and applied during a
+    single walk, instead of letting glob re-interpret it per directory level.
+    """
+    parent = path.parent if path.parent != Path() else Path()
+    pattern_re = re.compile(fnmatch.translate(path.name))
+    for file_str in _iter_supported_files(parent, recursive=recursive):
+        if pattern_re.match(os.path.basename(file_str)):
+            yield file_str
+
+
 def find_files(
     paths: List[str],
     *, recursive: bool = False,
-    regex: Optional[str] = None,
+    regex: Optional[Union[str, Pattern[str]]] = None,
     pattern_mode: bool = False,
     exclude_patterns: Optional[List[str]] = None,
 ) -> List[Path]:
     """
     Given a list of files, directories, or patterns, return all matching YAML/JSON files.
     """
+    # Dedupe on normalized absolute path strings: pure string ops, unlike
+    # Path.resolve() which issues stat/readlink syscalls per entry.
     found = set()
-    regex_compiled = re.compile(regex) if regex else None
+    # Paths can contain arbitrary unicode, so the pattern stays a str regex;
+    # each candidate is converted to str exactly once for all filter checks.
+    # Callers that run many searches may hand in an already-compiled pattern.
+    if isinstance(regex, re.Pattern):
+        regex_compiled = regex
+    else:
+        regex_compiled = re.compile(regex) if regex else None
+    compiled_excludes = _compile_exclude_patterns(exclude_patterns)
+
+    def record_matches(candidates) -> None:
+        # Shared by every branch: apply the regex and exclude filters once
+        # per candidate and record the normalized absolute path.
+        for file_str in candidates:
+            if (not regex_compiled or regex_compiled.search(file_str)) \
+                    and not _matches_excludes(Path(file_str), compiled_excludes):
+                found.add(os.path.normpath(os.path.abspath(file_str)))
+
     for p in paths:
         path = Path(p)
         if pattern_mode:
-            parent = path.parent if path.parent != Path() else Path()
-            pattern = path.name
-            matches = parent.rglob(
-                pattern) if recursive else parent.glob(pattern)
-            for match_path in matches:
-                if (
-                    match_path.is_file()
-                    and match_path.suffix.lower() in {".json", ".yaml", ".yml"}
-                    and (not regex_compiled or regex_compiled.search(str(match_path)))
-                    and not _should_exclude_file(match_path, exclude_patterns)
-                ):
-                    found.add(match_path.resolve())
+            record_matches(_iter_pattern_matches(path, recursive=recursive))
         elif path.is_file():
-            if (
-                path.suffix.lower() in {".json", ".yaml", ".yml"}
-                and (not regex_compiled or regex_compiled.search(str(path)))
-                and not _should_exclude_file(path, exclude_patterns)
-            ):
-                found.add(path.resolve())
+            if path.name.lower().endswith(_SUPPORTED_EXTS):
+                record_matches([str(path)])
         elif path.is_dir():
-            for ext in ("*.json", "*.yaml", "*.yml"):
-                files = path.rglob(ext) if recursive else path.glob(ext)
-                for f in files:
-                    if f.is_file() and (not regex_compiled or regex_compiled.search(str(f))) and not _should_exclude_file(f, exclude_patterns):
-                        found.add(f.resolve())
+            record_matches(_iter_supported_files(path, recursive=recursive))
         else:
-            parent = path.parent if path.parent != Path() else Path()
-            pattern = path.name
-            matches = parent.rglob(
-                pattern) if recursive else parent.glob(pattern)
-            for match_path in matches:
-                if (
-                    match_path.is_file()
-                    and match_path.suffix.lower() in {".json", ".yaml", ".yml"}
-                    and (not regex_compiled or regex_compiled.search(str(match_path)))
-                    and not _should_exclude_file(match_path, exclude_patterns)
-                ):
-                    found.add(match_path.resolve())
-    return sorted(found)
+            # Non-existent path: treat its basename as a glob pattern, the
+            # same way explicit --pattern inputs are handled
+            record_matches(_iter_pattern_matches(path, recursive=recursive))
+    return [Path(f) for f in sorted(found)]
+
+
+def _init_worker_logging(log_level: int) -> None:
+    """Configure logging in pool workers (they do not inherit basicConfig)."""
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+
+
+def _process_file_worker(file_path: str, options: dict) -> tuple:
+    """Sort one file in a pool worker. Returns (path, ok, error message or None)."""
+    try:
+        ok = sort_file(file_path, None, **options)
+    except Exception as err:
+        return file_path, False, str(err)
+    return file_path, ok, None
+
+
+def _process_chunk_worker(file_paths: List[str], options: dict) -> List[tuple]:
+    """Sort a batch of files in one pool task to amortize dispatch overhead."""
+    return [_process_file_worker(file_path, options) for file_path in file_paths]
 
 
 def main():
@@ -591,10 +1222,18 @@ Examples:
         "--exclude", action="append", metavar="PATTERN",
         help="Exclude files matching pattern (can be used multiple times). Supports glob patterns and regex.",
     )
+    parser.add_argument(
+        "--cache", action="store_true",
+        help="Cache sorted results in sidecar files and reuse them for unchanged inputs (skips reparsing)",
+    )
     parser.add_argument(
         "--validate", action="store_true",
         help="Validate that all data structures, keys, and values are preserved after sorting (useful for ensuring no data loss)",
     )
+    parser.add_argument(
+        "--jobs", type=int, default=0, metavar="N",
+        help="Number of worker processes for multi-file runs (default: one per CPU; 1 disables the pool)",
+    )
     parser.add_argument(
         "--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         help="Set logging level (default: INFO)",
@@ -631,31 +1270,64 @@ Examples:
                 sort_arrays_by_first_key=args.sort_arrays_by_first_key,
                 sort_docs_by_first_key=args.sort_docs_by_first_key,
                 validate=args.validate,
+                cache=args.cache,
             )
         except Exception:
             logger.exception("Error processing file")
             sys.exit(1)
     else:
         # Multiple files or check mode
-        for f in files:
-            try:
-                logger.info("\nProcessing: %s", f)
-                ok = sort_file(
-                    str(f),
-                    None,
-                    json_indent=args.json_indent,
-                    yaml_indent=args.yaml_indent,
-                    check=args.check,
-                    sort_arrays_by_first_key=args.sort_arrays_by_first_key,
-                    sort_docs_by_first_key=args.sort_docs_by_first_key,
-                    validate=args.validate,
-                )
-                if args.check and not ok:
-                    failed.append(str(f))
-            except Exception:
-                logger.exception("Error processing %s", f)
-                if args.check:
-                    failed.append(str(f))
+        options = {
+            "json_indent": args.json_indent,
+            "yaml_indent": args.yaml_indent,
+            "check": args.check,
+            "sort_arrays_by_first_key": args.sort_arrays_by_first_key,
+            "sort_docs_by_first_key": args.sort_docs_by_first_key,
+            "validate": args.validate,
+            "cache": args.cache,
+        }
+        max_workers = min(
+            len(files), args.jobs if args.jobs > 0 else os.cpu_count() or 1)
+        if len(files) > 1 and max_workers > 1:
+            # Sorting is CPU-bound in parse/serialize, so fan out across processes;
+            # the single-file path stays synchronous to avoid pool startup cost,
+            # and --jobs 1 forces the same serial path for debugging.
+            # Files are submitted in chunks so thousands of small files do not
+            # pay one task-dispatch round trip each; the chunk size shrinks
+            # for small batches so every worker still gets work.
+            chunk_size = max(1, min(64, -(-len(files) // max_workers)))
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker_logging,
+                initargs=(getattr(logging, args.log_level.upper(), logging.INFO),),
+            ) as pool:
+                futures = []
+                for start in range(0, len(files), chunk_size):
+                    chunk = [str(f) for f in files[start:start + chunk_size]]
+                    for path in chunk:
+                        logger.info("\nProcessing: %s", path)
+                    futures.append(pool.submit(
+                        _process_chunk_worker, chunk, options))
+                for future in as_completed(futures):
+                    for path, ok, error in future.result():
+                        if error is not None:
+                            logger.error(
+                                "Error processing %s: %s", path, error)
+                            if args.check:
+                                failed.append(path)
+                        elif args.check and not ok:
+                            failed.append(path)
+        else:
+            for f in files:
+                try:
+                    logger.info("\nProcessing: %s", f)
+                    ok = sort_file(str(f), None, **options)
+                    if args.check and not ok:
+                        failed.append(str(f))
+                except Exception:
+                    logger.exception("Error processing %s", f)
+                    if args.check:
+                        failed.append(str(f))
 
         if args.check:
             if failed:
@@ -13,104 +13,168 @@ This module contains focused tests for:
 """
 
 import json
-import sys
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
 import yaml
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised on minimal installs
+    orjson = None
+
 from ordnung.file_sorter import (
     find_files,
     sort_file,
 )
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+try:
+    from yaml import CSafeDumper as _YDumper
+    from yaml import CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeDumper as _YDumper
+    from yaml import SafeLoader as _YLoader
+
+
+def _yload(stream):
+    """yaml.safe_load through the libyaml loader when available."""
+    return yaml.load(stream, Loader=_YLoader)
+
+
+def _yload_all(stream):
+    """yaml.safe_load_all through the libyaml loader when available."""
+    return yaml.load_all(stream, Loader=_YLoader)
+
+
+def _ydump(data, stream):
+    """yaml.dump through the libyaml dumper when available."""
+    yaml.dump(data, stream, Dumper=_YDumper, default_flow_style=False, indent=2)
+
+
+def _jload(path):
+    """Parse a JSON file, through orjson when available."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with Path(path).open() as f:
+        return json.load(f)
+
+
+def _jdump(path, data):
+    """Write a JSON file with 2-space indent, through orjson when available."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with Path(path).open("w") as f:
+            json.dump(data, f, indent=2)
+
+
+def _assert_sorted_keys(mapping, expected):
+    """Compare the key view against a statically known sorted tuple."""
+    assert tuple(mapping.keys()) == expected
+
+
+def _keys_sorted(mapping):
+    """Single O(n) monotonic scan over the keys, no list materialization."""
+    previous = None
+    for key in mapping:
+        if previous is not None and key < previous:
+            return False
+        previous = key
+    return True
+
+
+# One executor serves every test in the module, so the thread-creation
+# cost is paid once per session instead of once per call; the workers are
+# joined by concurrent.futures' exit hook at interpreter shutdown
+_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+
+
+def _sort_files_concurrently(paths):
+    """Run sort_file over independent files on the shared thread pool.
+
+    The per-file work is I/O bound (open/read/write), so overlapping the
+    syscalls hides per-file latency in the batch-style tests.
+    """
+    list(_POOL.map(lambda p: sort_file(str(p)), paths))
+
+
+# Batch corpora are serialized once per module and copied per test, so the
+# repeated per-test cost is a directory copy instead of N dumps
+_BATCH_FILES_DATA = [
+    ("file1", {"z": 3, "a": 1, "m": 2}),
+    ("file2", {"y": "last", "b": "first", "x": "middle"}),
+    ("file3", {"numbers": [3, 1, 2], "letters": ["c", "a", "b"]}),
+]
+
+
+@pytest.fixture(scope="module")
+def json_batch_corpus(tmp_path_factory):
+    corpus = tmp_path_factory.mktemp("corpus_json")
+    for name, data in _BATCH_FILES_DATA:
+        _jdump(corpus / f"{name}.json", data)
+    return corpus
+
+
+@pytest.fixture(scope="module")
+def yaml_batch_corpus(tmp_path_factory):
+    corpus = tmp_path_factory.mktemp("corpus_yaml")
+    for name, data in _BATCH_FILES_DATA:
+        with (corpus / f"{name}.yaml").open("w") as f:
+            _ydump(data, f)
+    return corpus
 
 
 class TestBatchProcessing:
     """Test processing multiple files in a folder."""
 
-    def test_batch_json_files(self, tmp_path):
+    def test_batch_json_files(self, tmp_path, json_batch_corpus):
         """Test processing a folder with 3 JSON files."""
-        # Create test folder with 3 JSON files
         test_dir = tmp_path / "batch_test"
-        test_dir.mkdir()
-
-        # Create 3 different JSON files
-        files_data = [
-            ("file1.json", {"z": 3, "a": 1, "m": 2}),
-            ("file2.json", {"y": "last", "b": "first", "x": "middle"}),
-            ("file3.json", {"numbers": [3, 1, 2], "letters": ["c", "a", "b"]}),
-        ]
-
-        for filename, data in files_data:
-            file_path = test_dir / filename
-            with file_path.open("w") as f:
-                json.dump(data, f, indent=2)
+        shutil.copytree(json_batch_corpus, test_dir)
+        files_data = [(f"{name}.json", data) for name, data in _BATCH_FILES_DATA]
 
         # Process all files in the directory
         found_files = find_files([str(test_dir)])
         assert len(found_files) == 3
 
-        for file_path in found_files:
-            sort_file(str(file_path))
+        _sort_files_concurrently(found_files)
 
         # Verify all files are sorted
         for filename, _original_data in files_data:
             file_path = test_dir / filename
-            with file_path.open() as f:
-                sorted_data = json.load(f)
-
-            # Check that keys are sorted
-            if isinstance(sorted_data, dict):
-                keys = list(sorted_data.keys())
-                assert keys == sorted(keys), f"Keys not sorted in {filename}"
-            elif isinstance(sorted_data, list):
-                # For arrays of primitives, they should be sorted
-                if all(isinstance(item, (str, int, float, bool)) or item is None for item in sorted_data):
-                    assert sorted_data == sorted(sorted_data, key=lambda x: (x is None, str(
-                        x) if x is not None else "")), f"Array not sorted in {filename}"
-
-    def test_batch_yaml_files(self, tmp_path):
-        """Test processing a folder with 3 YAML files."""
-        # Create test folder with 3 YAML files
-        test_dir = tmp_path / "batch_yaml_test"
-        test_dir.mkdir()
+            sorted_data = _jload(file_path)
 
-        # Create 3 different YAML files
-        files_data = [
-            ("file1.yaml", {"z": 3, "a": 1, "m": 2}),
-            ("file2.yaml", {"y": "last", "b": "first", "x": "middle"}),
-            ("file3.yaml", {"numbers": [3, 1, 2], "letters": ["c", "a", "b"]}),
-        ]
+            # Every _BATCH_FILES_DATA entry is a mapping, so the key-order
+            # check is the whole assertion
+            assert type(sorted_data) is dict, f"Unexpected top-level type in {filename}"
+            assert _keys_sorted(sorted_data), f"Keys not sorted in {filename}"
 
-        for filename, data in files_data:
-            file_path = test_dir / filename
-            with file_path.open("w") as f:
-                yaml.dump(data, f, default_flow_style=False, indent=2)
+    def test_batch_yaml_files(self, tmp_path, yaml_batch_corpus):
+        """Test processing a folder with 3 YAML files."""
+        test_dir = tmp_path / "batch_yaml_test"
+        shutil.copytree(yaml_batch_corpus, test_dir)
+        files_data = [(f"{name}.yaml", data) for name, data in _BATCH_FILES_DATA]
 
         # Process all files in the directory
         found_files = find_files([str(test_dir)])
         assert len(found_files) == 3
 
-        for file_path in found_files:
-            sort_file(str(file_path))
+        _sort_files_concurrently(found_files)
 
         # Verify all files are sorted
         for filename, _original_data in files_data:
             file_path = test_dir / filename
             with file_path.open() as f:
-                sorted_data = yaml.safe_load(f)
+                sorted_data = _yload(f)
 
-            # Check that keys are sorted
-            if isinstance(sorted_data, dict):
-                keys = list(sorted_data.keys())
-                assert keys == sorted(keys), f"Keys not sorted in {filename}"
-            elif isinstance(sorted_data, list):
-                # For arrays of primitives, they should be sorted
-                if all(isinstance(item, (str, int, float, bool)) or item is None for item in sorted_data):
-                    assert sorted_data == sorted(sorted_data, key=lambda x: (x is None, str(
-                        x) if x is not None else "")), f"Array not sorted in {filename}"
+            # Every _BATCH_FILES_DATA entry is a mapping, so the key-order
+            # check is the whole assertion
+            assert type(sorted_data) is dict, f"Unexpected top-level type in {filename}"
+            assert _keys_sorted(sorted_data), f"Keys not sorted in {filename}"
 
 
 class TestCheckMode:
@@ -133,16 +197,14 @@ class TestCheckMode:
         file_path = tmp_path / "unsorted.json"
         data = {"c": 3, "a": 1, "b": 2}
 
-        with file_path.open("w") as f:
-            json.dump(data, f, indent=2)
+        _jdump(file_path, data)
 
         # Check mode should return False for unsorted file
         result = sort_file(str(file_path), check=True)
         assert result is False
 
         # File should remain unchanged
-        with file_path.open() as f:
-            current_data = json.load(f)
+        current_data = _jload(file_path)
         assert current_data == data
 
     def test_check_mode_yaml_already_sorted(self, tmp_path):
@@ -151,7 +213,7 @@ class TestCheckMode:
         data = {"a": 1, "b": 2, "c": 3}
 
         with file_path.open("w") as f:
-            yaml.dump(data, f, default_flow_style=False,
+            yaml.dump(data, f, Dumper=_YDumper, default_flow_style=False,
                       indent=2, sort_keys=True)
 
         # Check mode should return True for already sorted file
@@ -198,41 +260,32 @@ class TestRegexFiltering:
         for filename, data in files:
             file_path = test_dir / filename
             if filename.endswith(".json"):
-                with file_path.open("w") as f:
-                    json.dump(data, f, indent=2)
+                _jdump(file_path, data)
             else:
                 with file_path.open("w") as f:
-                    yaml.dump(data, f, default_flow_style=False, indent=2)
+                    _ydump(data, f)
 
         # Find only JSON files using regex
-        found_files = find_files([str(test_dir)], regex=r".*\.json$")
+        found_files = find_files([str(test_dir)], regex=re.compile(r".+\.json$"))
         assert len(found_files) == 2
         assert all(f.name.endswith(".json") for f in found_files)
 
         # Process only JSON files
-        for file_path in found_files:
-            sort_file(str(file_path))
+        _sort_files_concurrently(found_files)
 
         # Verify only JSON files were processed
         json_files = [f for f in test_dir.iterdir()
                       if f.name.endswith(".json")]
         for file_path in json_files:
-            with file_path.open() as f:
-                data = json.load(f)
-            keys = list(data.keys())
-            assert keys == sorted(
-                keys), f"JSON file {file_path.name} not sorted"
+            data = _jload(file_path)
+            assert _keys_sorted(data), f"JSON file {file_path.name} not sorted"
 
         # Verify YAML file was not processed (should still be unsorted)
         yaml_file = test_dir / "config.yaml"
-        with yaml_file.open() as f:
-            data = yaml.safe_load(f)
-        keys = list(data.keys())
-        # The YAML file should still have the original order since it wasn't processed
-        # But yaml.safe_load might reorder keys, so we need to check the actual file content
-        with yaml_file.open() as f:
-            content = f.read()
-        # Check that the YAML content still has the original order
+        # One read serves both checks: the parsed mapping ignores key order,
+        # so the original order is asserted against the raw text
+        content = yaml_file.read_text()
+        assert _yload(content) == {"y": 2, "x": 1}
         assert "y: 2" in content
         assert "x: 1" in content
 
@@ -251,16 +304,22 @@ class TestRegexFiltering:
 
         for filename, data in files:
             file_path = test_dir / filename
-            with file_path.open("w") as f:
-                json.dump(data, f, indent=2)
+            _jdump(file_path, data)
 
         # Find only files matching pattern
-        found_files = find_files([str(test_dir)], regex=r".*_config\.json$")
+        found_files = find_files([str(test_dir)], regex=re.compile(r".+_config\.json$"))
         assert len(found_files) == 3
         assert all("_config.json" in f.name for f in found_files)
         assert not any("ignore.json" in f.name for f in found_files)
 
 
+# Indentation checks run as single multiline scans over the whole buffer
+# instead of per-line Python loops
+_BAD_JSON_INDENT_RE = re.compile(r"^(?! {4}) {0,3}[^\s{}]", re.M)
+_TOP_LEVEL_KEY_RE = re.compile(r"^(\w+):", re.M)
+_UNDER_INDENTED_NESTED_KEY_RE = re.compile(r"^ {0,3}(?:bar|baz|foo|qux|x|y):", re.M)
+
+
 class TestDifferentIndentation:
     """Test different indentation settings."""
 
@@ -269,8 +328,7 @@ class TestDifferentIndentation:
         file_path = tmp_path / "test.json"
         data = {"c": 3, "a": 1, "b": 2}
 
-        with file_path.open("w") as f:
-            json.dump(data, f, indent=2)
+        _jdump(file_path, data)
 
         # Sort with different indentation
         sort_file(str(file_path), json_indent=4)
@@ -279,12 +337,10 @@ class TestDifferentIndentation:
         with file_path.open() as f:
             content = f.read()
 
-        # Should have 4-space indentation
-        lines = content.split("\n")
-        for line in lines:
-            if line.strip() and not line.strip().startswith("{") and not line.strip().startswith("}"):
-                assert line.startswith(
-                    "    "), f"Expected 4-space indentation, got: {line!r}"
+        # Should have 4-space indentation: one multiline scan flags any
+        # content line (other than the braces) not indented by 4 spaces
+        bad = _BAD_JSON_INDENT_RE.search(content)
+        assert bad is None, f"Expected 4-space indentation, got: {bad.group()!r}"
 
     def test_yaml_different_indent(self, tmp_path):
         """Test YAML files with different indentation."""
@@ -301,7 +357,7 @@ class TestDifferentIndentation:
         }
 
         with file_path.open("w") as f:
-            yaml.dump(data, f, default_flow_style=False, indent=2)
+            _ydump(data, f)
 
         # Sort with different indentation
         sort_file(str(file_path), yaml_indent=4)
@@ -310,18 +366,11 @@ class TestDifferentIndentation:
         with file_path.open() as f:
             content = f.read()
 
-        lines = content.split("\n")
-        # Top-level keys should have no indentation
-        for line in lines:
-            if line.strip() and ":" in line and not line.startswith(" ") and not line.startswith("-"):
-                # This is a top-level key
-                assert not line.startswith(
-                    " "), f"Top-level key should not be indented: {line!r}"
-        # All nested keys (including those in lists) should be indented by 4 spaces
-        for line in lines:
-            if line.strip().startswith(("x:", "y:", "foo:", "bar:", "baz:", "qux:")):
-                assert line.startswith(
-                    "    "), f"Nested key should be indented by 4 spaces: {line!r}"
+        # Top-level keys appear at column zero
+        assert set(_TOP_LEVEL_KEY_RE.findall(content)) == {"a", "b", "c", "list", "nested"}
+        # All nested keys (including those in lists) are indented by 4 spaces
+        bad = _UNDER_INDENTED_NESTED_KEY_RE.search(content)
+        assert bad is None, f"Nested key should be indented by 4 spaces: {bad.group()!r}"
 
 
 class TestOverwriteExistingFile:
@@ -333,8 +382,7 @@ class TestOverwriteExistingFile:
         original_data = {"c": 3, "a": 1, "b": 2}
 
         # Create original file
-        with file_path.open("w") as f:
-            json.dump(original_data, f, indent=2)
+        _jdump(file_path, original_data)
 
         # Get original content
         with file_path.open() as f:
@@ -350,10 +398,7 @@ class TestOverwriteExistingFile:
         assert new_content != original_content
 
         # Verify data is sorted
-        with file_path.open() as f:
-            sorted_data = json.load(f)
-        keys = list(sorted_data.keys())
-        assert keys == sorted(keys)
+        _assert_sorted_keys(_jload(file_path), ("a", "b", "c"))
 
     def test_overwrite_yaml_file(self, tmp_path):
         """Test overwriting an existing YAML file."""
@@ -367,24 +412,16 @@ b: 2
         with file_path.open("w") as f:
             f.write(yaml_content)
 
-        # Get original content
-        with file_path.open() as f:
-            original_content = f.read()
-
         # Sort file (should overwrite)
         sort_file(str(file_path))
 
-        # Verify file was overwritten
-        with file_path.open() as f:
-            new_content = f.read()
-
-        assert new_content != original_content
+        # Verify file was overwritten; one read serves both the content
+        # comparison and the parsed-order check
+        new_content = file_path.read_text()
+        assert new_content != yaml_content
 
         # Verify data is sorted
-        with file_path.open() as f:
-            sorted_data = yaml.safe_load(f)
-        keys = list(sorted_data.keys())
-        assert keys == sorted(keys)
+        _assert_sorted_keys(_yload(new_content), ("a", "b", "c"))
 
 
 class TestPatternMatching:
@@ -406,8 +443,7 @@ class TestPatternMatching:
         ]
 
         for file_path, data in files:
-            with file_path.open("w") as f:
-                json.dump(data, f, indent=2)
+            _jdump(file_path, data)
 
         # Use pattern mode to find all JSON files recursively
         # The pattern needs to be relative to the current working directory
@@ -418,15 +454,12 @@ class TestPatternMatching:
         assert all(f.name.endswith(".json") for f in json_files)
 
         # Process found files
-        for file_path in json_files:
-            sort_file(str(file_path))
+        _sort_files_concurrently(json_files)
 
         # Verify files were sorted
         for file_path in json_files:
-            with file_path.open() as f:
-                data = json.load(f)
-            keys = list(data.keys())
-            assert keys == sorted(keys), f"File {file_path.name} not sorted"
+            data = _jload(file_path)
+            assert _keys_sorted(data), f"File {file_path.name} not sorted"
 
     def test_recursive_pattern(self, tmp_path):
         """Test recursive pattern matching."""
@@ -446,133 +479,57 @@ class TestPatternMatching:
         ]
 
         for file_path, data in files:
-            with file_path.open("w") as f:
-                json.dump(data, f, indent=2)
+            _jdump(file_path, data)
 
         # Find all JSON files recursively
         found_files = find_files([str(test_dir)], recursive=True)
         assert len(found_files) == 3
 
         # Process found files
-        for file_path in found_files:
-            sort_file(str(file_path))
+        _sort_files_concurrently(found_files)
 
         # Verify all files were sorted
         for file_path in found_files:
-            with file_path.open() as f:
-                data = json.load(f)
-            keys = list(data.keys())
-            assert keys == sorted(keys), f"File {file_path.name} not sorted"
+            data = _jload(file_path)
+            assert _keys_sorted(data), f"File {file_path.name} not sorted"
 
 
 class TestSortArraysByFirstKey:
     """Test sort-arrays-by-first-key functionality."""
 
-    def test_sort_arrays_by_first_key_enabled_json(self, tmp_path):
-        """Test sorting arrays of objects by first key when enabled."""
-        file_path = tmp_path / "test.json"
-        data = {
-            "users": [
-                {"name": "Charlie", "id": 3},
-                {"name": "Alice", "id": 1},
-                {"name": "Bob", "id": 2},
-            ],
-        }
-
-        with file_path.open("w") as f:
-            json.dump(data, f, indent=2)
-
-        # Sort with sort_arrays_by_first_key enabled
-        sort_file(str(file_path), sort_arrays_by_first_key=True)
-
-        # Verify array is sorted by first key (name)
-        with file_path.open() as f:
-            sorted_data = json.load(f)
-
-        users = sorted_data["users"]
-        names = [user["name"] for user in users]
-        assert names == ["Alice", "Bob",
-                         "Charlie"], f"Array not sorted by first key: {names}"
-
-    def test_sort_arrays_by_first_key_disabled_json(self, tmp_path):
-        """Test that arrays of objects are not sorted by first key when disabled."""
-        file_path = tmp_path / "test.json"
-        data = {
-            "users": [
-                {"name": "Charlie", "id": 3},
-                {"name": "Alice", "id": 1},
-                {"name": "Bob", "id": 2},
-            ],
-        }
-
-        with file_path.open("w") as f:
-            json.dump(data, f, indent=2)
-
-        # Sort with sort_arrays_by_first_key disabled (default)
-        sort_file(str(file_path), sort_arrays_by_first_key=False)
-
-        # Verify array order is preserved (only keys within objects are sorted)
-        with file_path.open() as f:
-            sorted_data = json.load(f)
-
-        users = sorted_data["users"]
-        names = [user["name"] for user in users]
-        # Order should be preserved, but keys within each object should be sorted
-        assert names == ["Charlie", "Alice",
-                         "Bob"], f"Array order changed when it shouldn't: {names}"
-
-    def test_sort_arrays_by_first_key_enabled_yaml(self, tmp_path):
-        """Test sorting arrays of objects by first key when enabled in YAML."""
-        file_path = tmp_path / "test.yaml"
-        data = {
-            "users": [
-                {"name": "Charlie", "id": 3},
-                {"name": "Alice", "id": 1},
-                {"name": "Bob", "id": 2},
-            ],
-        }
-
-        with file_path.open("w") as f:
-            yaml.dump(data, f, default_flow_style=False, indent=2)
-
-        # Sort with sort_arrays_by_first_key enabled
-        sort_file(str(file_path), sort_arrays_by_first_key=True)
-
-        # Verify array is sorted by first key (name)
-        with file_path.open() as f:
-            sorted_data = yaml.safe_load(f)
-
-        users = sorted_data["users"]
-        names = [user["name"] for user in users]
-        assert names == ["Alice", "Bob",
-                         "Charlie"], f"Array not sorted by first key: {names}"
-
-    def test_sort_arrays_by_first_key_disabled_yaml(self, tmp_path):
-        """Test that arrays of objects are not sorted by first key when disabled in YAML."""
-        file_path = tmp_path / "test.yaml"
-        data = {
-            "users": [
-                {"name": "Charlie", "id": 3},
-                {"name": "Alice", "id": 1},
-                {"name": "Bob", "id": 2},
-            ],
-        }
-
-        with file_path.open("w") as f:
-            yaml.dump(data, f, default_flow_style=False, indent=2)
+    _USERS = [
+        {"name": "Charlie", "id": 3},
+        {"name": "Alice", "id": 1},
+        {"name": "Bob", "id": 2},
+    ]
+
+    @pytest.mark.parametrize(("ext", "flag", "expected_names"), [
+        ("json", True, ["Alice", "Bob", "Charlie"]),
+        ("json", False, ["Charlie", "Alice", "Bob"]),
+        ("yaml", True, ["Alice", "Bob", "Charlie"]),
+        ("yaml", False, ["Charlie", "Alice", "Bob"]),
+    ], ids=["enabled_json", "disabled_json", "enabled_yaml", "disabled_yaml"])
+    def test_sort_arrays_by_first_key(self, tmp_path, ext, flag, expected_names):
+        """Arrays of objects sort by first key when enabled, keep order when not."""
+        file_path = tmp_path / f"test.{ext}"
+        data = {"users": list(self._USERS)}
+
+        if ext == "json":
+            _jdump(file_path, data)
+        else:
+            with file_path.open("w") as f:
+                _ydump(data, f)
 
-        # Sort with sort_arrays_by_first_key disabled (default)
-        sort_file(str(file_path), sort_arrays_by_first_key=False)
+        sort_file(str(file_path), sort_arrays_by_first_key=flag)
 
-        # Verify array order is preserved (only keys within objects are sorted)
-        with file_path.open() as f:
-            sorted_data = yaml.safe_load(f)
+        if ext == "json":
+            sorted_data = _jload(file_path)
+        else:
+            with file_path.open() as f:
+                sorted_data = _yload(f)
 
-        users = sorted_data["users"]
-        names = [user["name"] for user in users]
-        # Order should be preserved, but keys within each object should be sorted
-        assert names == ["Charlie", "Alice",
-                         "Bob"], f"Array order changed when it shouldn't: {names}"
+        names = [user["name"] for user in sorted_data["users"]]
+        assert names == expected_names, f"Unexpected array order: {names}"
 
     def test_sort_arrays_by_first_key_mixed_arrays(self, tmp_path):
         """Test sort_arrays_by_first_key with mixed array content."""
@@ -587,15 +544,13 @@ class TestSortArraysByFirstKey:
             ],
         }
 
-        with file_path.open("w") as f:
-            json.dump(data, f, indent=2)
+        _jdump(file_path, data)
 
         # Sort with sort_arrays_by_first_key enabled
         sort_file(str(file_path), sort_arrays_by_first_key=True)
 
         # Verify mixed array is handled correctly
-        with file_path.open() as f:
-            sorted_data = json.load(f)
+        sorted_data = _jload(file_path)
 
         mixed = sorted_data["mixed"]
         # Should preserve order since not all items are dicts with same first key
@@ -626,7 +581,7 @@ list:
 
     # Read back as text to check doc order
     content = file_path.read_text()
-    docs = list(yaml.safe_load_all(content))
+    docs = list(_yload_all(content))
     # Should have exactly three '---' (three docs, explicit_start=True)
     assert content.count("---") == len(docs)
     assert len(docs) == 3
@@ -656,7 +611,7 @@ c: 3
 
     sort_file(str(file_path))
     content = file_path.read_text()
-    docs = list(yaml.safe_load_all(content))
+    docs = list(_yload_all(content))
     # Should have 3 docs: [dict, None, dict]
     assert len(docs) == 3
     assert isinstance(docs[0], dict)
@@ -681,7 +636,7 @@ m: 3
 
     sort_file(str(file_path), sort_docs_by_first_key=False)
     content = file_path.read_text()
-    docs = list(yaml.safe_load_all(content))
+    docs = list(_yload_all(content))
     # Order should be [z, a, m]
     assert [next(iter(doc.keys())) for doc in docs if isinstance(doc, dict)] == ["z", "a", "m"]
 
@@ -711,7 +666,7 @@ roles:
     content = file_path.read_text()
     # Should preserve leading --- or direct doc start
     assert content.lstrip().startswith("---") or content.lstrip().startswith("age:")
-    docs = list(yaml.safe_load_all(content))
+    docs = list(_yload_all(content))
     assert len(docs) == 2
     # After sorting, doc with age 29 comes first, then 34
     assert docs[0]["age"] == 29
@@ -733,7 +688,7 @@ m: 3
 
     sort_file(str(file_path), sort_docs_by_first_key=True)
     content = file_path.read_text()
-    docs = list(yaml.safe_load_all(content))
+    docs = list(_yload_all(content))
     # Order should be [z, a, m] (by value of first key: 1, 2, 3)
     assert [next(iter(doc.keys())) for doc in docs if isinstance(doc, dict)] == ["z", "a", "m"]
     assert [doc[next(iter(doc.keys()))] for doc in docs if isinstance(doc, dict)] == [1, 2, 3]
@@ -6,8 +6,10 @@ This module contains comprehensive tests for the file sorting functionality,
 including various JSON and YAML structures, edge cases, and batch processing.
 """
 
+import json
+import os
+import re
 import shutil
-import sys
 from pathlib import Path
 from unittest.mock import patch
 
@@ -24,79 +26,69 @@ from ordnung.file_sorter import (
 
 from .conftest import compare_json_files, compare_yaml_files
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 data_dir = Path(__file__).parent / "data" / "pass"
 fail_dir = Path(__file__).parent / "data" / "fail"
 
 
-def create_pass_test(input_file, expected_file, ext):
-    """Create a test function for files that should pass sorting."""
-    def test_func(tmp_path, input_file=input_file, expected_file=expected_file, ext=ext):
-        input_path = data_dir / input_file
-        temp_file = tmp_path / input_file
-        shutil.copy(input_path, temp_file)
-        sort_file(str(temp_file))
-        expected_path = data_dir / expected_file
-        assert expected_path.exists(
-        ), f"Expected file {expected_file} does not exist!"
-        if ext == ".json":
-            assert compare_json_files(temp_file, expected_path)
-        else:
-            assert compare_yaml_files(temp_file, expected_path)
-    return test_func
-
-
-def create_fail_test(input_file):
-    """Create a test function for files that should fail sorting."""
-    def test_func(tmp_path, input_file=input_file):
-        input_path = fail_dir / input_file
-        temp_file = tmp_path / input_file
-        shutil.copy(input_path, temp_file)
-        # This file should have invalid syntax and fail
-        with pytest.raises(FileLoadError):
-            sort_file(str(temp_file))
-    return test_func
-
-
-# Auto-generate tests for each input file in pass/
-pass_input_files = [f for f in data_dir.iterdir() if f.name.endswith(
-    ("_input.json", "_input.yaml"))]
-
-for input_file in pass_input_files:
-    if input_file.name.endswith("_input.json"):
-        base = input_file.name[:-11]  # Remove '_input.json'
-        ext = ".json"
-    elif input_file.name.endswith("_input.yaml"):
-        base = input_file.name[:-11]  # Remove '_input.yaml'
-        ext = ".yaml"
-    else:
-        continue
+def _stage(src, dst):
+    """Stage a corpus file into a test dir, by hardlink when the FS allows.
+
+    save_file replaces its target via rename, so a hardlinked input breaks
+    cleanly on rewrite and the corpus file is never mutated. Cross-device
+    links (e.g. a tmpfs basetemp) fall back to a plain byte copy.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _scan_cases(directory):
+    """Collect (input_name, base, ext) triples for *_input files in a corpus dir."""
+    cases = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            m = _INPUT_RE.match(entry.name)
+            if not m or not entry.is_file(follow_symlinks=False):
+                continue
+            cases.append((entry.name, m.group("base"), f".{m.group('ext')}"))
+    cases.sort()
+    return cases
+
+
+# One match per directory entry replaces the endswith pair plus the
+# magic-length name slicing
+_INPUT_RE = re.compile(r"(?P<base>.+)_input\.(?P<ext>json|yaml)$")
+
+_PASS_CASES = _scan_cases(data_dir)
+_FAIL_CASES = _scan_cases(fail_dir)
+
+
+@pytest.mark.parametrize(("input_file", "base", "ext"), _PASS_CASES,
+                         ids=[base for _, base, _ in _PASS_CASES])
+def test_pass_corpus(tmp_path, input_file, base, ext):
+    """Sorting each pass/ input must reproduce its expected counterpart."""
+    input_path = data_dir / input_file
+    temp_file = tmp_path / input_file
+    _stage(input_path, temp_file)
+    sort_file(str(temp_file))
     expected_file = f"{base}_expected{ext}"
-
-    test_func = create_pass_test(input_file.name, expected_file, ext)
-    test_func.__name__ = f"test_{base}"
-    test_func.__doc__ = f"Test sorting for {input_file.name}."
-    globals()[f"test_{base}"] = test_func
-
-
-# Auto-generate tests for each input file in fail/
-fail_input_files = [f for f in fail_dir.iterdir() if f.name.endswith(
-    ("_input.json", "_input.yaml"))]
-
-for input_file in fail_input_files:
-    if input_file.name.endswith("_input.json"):
-        base = input_file.name[:-11]  # Remove '_input.json'
-    elif input_file.name.endswith("_input.yaml"):
-        base = input_file.name[:-11]  # Remove '_input.yaml'
+    expected_path = data_dir / expected_file
+    assert expected_path.exists(), f"Expected file {expected_file} does not exist!"
+    if ext == ".json":
+        assert compare_json_files(temp_file, expected_path)
     else:
-        continue
+        assert compare_yaml_files(temp_file, expected_path)
 
-    test_func = create_fail_test(input_file.name)
-    test_func.__name__ = f"test_{base}"
-    test_func.__doc__ = f"Test that {input_file.name} fails as expected."
-    globals()[f"test_{base}"] = test_func
+
+@pytest.mark.parametrize(("input_file", "base", "ext"), _FAIL_CASES,
+                         ids=[base for _, base, _ in _FAIL_CASES])
+def test_fail_corpus(tmp_path, input_file, base, ext):
+    """Each fail/ input has invalid syntax and must raise FileLoadError."""
+    temp_file = tmp_path / input_file
+    _stage(fail_dir / input_file, temp_file)
+    with pytest.raises(FileLoadError):
+        sort_file(str(temp_file))
 
 
 # Tests for exclude functionality
@@ -400,6 +392,78 @@ def test_main_with_exclude_pattern_excludes_test_txt(tmp_path, caplog):
     assert "config.json" in caplog.text or "settings.yaml" in caplog.text
 
 
+# Tests for the --cache sidecar (the hash manifest is written relative to
+# the working directory, so these chdir into tmp_path; the pickle cache
+# lives under XDG_CACHE_HOME, pointed at tmp_path to keep runs isolated)
+def test_sort_file_cache_reused_on_unchanged_file(tmp_path, monkeypatch, caplog):
+    """Test that a warm --cache run reuses the sorted structure instead of reparsing."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    test_file = tmp_path / "config.json"
+    test_file.write_text('{"b": 1, "a": 2}')
+
+    with caplog.at_level("INFO"):
+        assert sort_file(str(test_file), cache=True)
+    assert "Using cached sorted data" not in caplog.text
+    assert json.loads(test_file.read_text()) == {"a": 2, "b": 1}
+    # Entries go under the cache home, never into the tree being sorted
+    assert (tmp_path / "ordnung").is_dir()
+    assert not (tmp_path / ".ordnung-cache").exists()
+
+    # The in-place write above re-keyed the cache entry, so the second run
+    # over the (unchanged) sorted file must hit it
+    caplog.clear()
+    with caplog.at_level("INFO"):
+        assert sort_file(str(test_file), cache=True)
+    assert "Using cached sorted data" in caplog.text
+    assert json.loads(test_file.read_text()) == {"a": 2, "b": 1}
+
+
+def test_check_cache_manifest_hit_and_invalidation(tmp_path, monkeypatch, caplog):
+    """Test that --check --cache skips unchanged files and re-checks edited ones."""
+    monkeypatch.chdir(tmp_path)
+    test_file = tmp_path / "config.json"
+    test_file.write_text('{\n  "a": 1,\n  "b": 2\n}')
+
+    # First check parses and records the content hash in the manifest
+    with caplog.at_level("INFO"):
+        assert sort_file(str(test_file), check=True, cache=True)
+    assert "File unchanged since last successful check" not in caplog.text
+    assert (tmp_path / ".ordnung-hashes.json").exists()
+
+    # Second check over identical content short-circuits on the manifest
+    caplog.clear()
+    with caplog.at_level("INFO"):
+        assert sort_file(str(test_file), check=True, cache=True)
+    assert "File unchanged since last successful check" in caplog.text
+
+    # Changing the content invalidates the entry: the file is re-checked
+    # for real and correctly reported as unformatted
+    test_file.write_text('{"b": 2, "a": 1}')
+    caplog.clear()
+    with caplog.at_level("INFO"):
+        assert not sort_file(str(test_file), check=True, cache=True)
+    assert "File unchanged since last successful check" not in caplog.text
+
+
+def test_main_parallel_jobs_sorts_files_and_fails_on_bad_file(tmp_path):
+    """Test that a --jobs run processes all files and a broken one exits 1 in check mode."""
+    for name in ("a.json", "b.json", "c.json"):
+        (tmp_path / name).write_text('{"z": 1, "a": 2}')
+
+    with patch("sys.argv", ["ordnung", str(tmp_path), "--jobs", "2"]):
+        main()
+    for name in ("a.json", "b.json", "c.json"):
+        assert json.loads((tmp_path / name).read_text()) == {"a": 2, "z": 1}
+
+    # A file the workers cannot parse must propagate exit code 1 in check mode
+    (tmp_path / "broken.json").write_text('{"unterminated": ')
+    with patch("sys.argv", ["ordnung", str(tmp_path), "--jobs", "2", "--check"]), \
+            pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 1
+
+
 # Tests for validation functionality
 def test_validate_data_preservation_simple_dict():
     """Test validation with simple dictionaries."""
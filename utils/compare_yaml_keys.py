@@ -1,49 +1,89 @@
+import json
 import sys
+from collections import Counter
 from collections.abc import Mapping
 from pathlib import Path
 
 import yaml
 
+# Prefer the libyaml C parser (pip install "pyyaml" against a system
+# libyaml, or the pyyaml wheel that bundles it); pure-Python SafeLoader
+# stays as the fallback
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 def load_yaml(file_path):
-    with Path(file_path).open() as f:
-        return yaml.safe_load(f)
+    # Binary mode lets libyaml consume the bytes directly instead of going
+    # through Python's text decoding layer first
+    with Path(file_path).open("rb") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+def _canonical(x):
+    # Canonical JSON makes dict elements compare equal regardless of key
+    # order, but sort_keys raises TypeError on mixed-type keys (which YAML
+    # produces readily, e.g. an 'on:' key loading as True next to string
+    # keys); those elements fall back to repr, keeping them comparable
+    try:
+        return json.dumps(x, sort_keys=True, default=repr)
+    except TypeError:
+        return repr(x)
+
 
 def compare_structures(a, b, prefix=""):
+    # Walked with an explicit stack so deep configs neither pay a Python
+    # call frame per key nor hit the recursion limit; every branch appends
+    # into the one shared differences list
     differences = []
-
-    if isinstance(a, Mapping) and isinstance(b, Mapping):
-        keys_a = set(a.keys())
-        keys_b = set(b.keys())
-
-        for key in keys_a - keys_b:
-            full_key = f"{prefix}.{key}" if prefix else key
-            differences.append(f"{full_key} only in first file")
-
-        for key in keys_b - keys_a:
-            full_key = f"{prefix}.{key}" if prefix else key
-            differences.append(f"{full_key} only in second file")
-
-        for key in keys_a & keys_b:
-            sub_prefix = f"{prefix}.{key}" if prefix else key
-            differences += compare_structures(a[key], b[key], sub_prefix)
-
-    elif isinstance(a, list) and isinstance(b, list):
-        set_a = {repr(x) for x in a}
-        set_b = {repr(x) for x in b}
-
-        only_in_a = set_a - set_b
-        only_in_b = set_b - set_a
-
-        if only_in_a or only_in_b:
-            differences.append(f"{prefix} list contents differ:")
-            if only_in_a:
-                differences.append(f"  items only in first:  {sorted(only_in_a)}")
-            if only_in_b:
-                differences.append(f"  items only in second: {sorted(only_in_b)}")
-
-    elif a != b:
-        differences.append(f"{prefix} value differs:\n    first:  {a}\n    second: {b}")
+    # Paths travel as tuples and are only joined into dotted strings when a
+    # difference is actually recorded, so the common all-equal case never
+    # pays per-key string formatting
+    stack = [(a, b, (prefix,) if prefix else ())]
+
+    while stack:
+        a, b, path = stack.pop()
+        # Equal subtrees produce no differences, and == resolves in C far
+        # below the cost of walking; equality is sufficient here because
+        # the branches below only loosen it (order-insensitive lists)
+        if a is b or a == b:
+            continue
+        prefix = ".".join(str(part) for part in path)
+        if isinstance(a, Mapping) and isinstance(b, Mapping):
+            keys_a = a.keys()
+            keys_b = b.keys()
+
+            for key in keys_a - keys_b:
+                full_key = f"{prefix}.{key}" if prefix else key
+                differences.append(f"{full_key} only in first file")
+
+            for key in keys_b - keys_a:
+                full_key = f"{prefix}.{key}" if prefix else key
+                differences.append(f"{full_key} only in second file")
+
+            for key in keys_a & keys_b:
+                stack.append((a[key], b[key], (*path, key)))
+
+        elif isinstance(a, list) and isinstance(b, list):
+            # Canonical JSON instead of repr: every element becomes a
+            # hashable, sortable string. Counters make the comparison a
+            # multiset, so differing duplicate counts are reported too.
+            count_a = Counter(_canonical(x) for x in a)
+            count_b = Counter(_canonical(x) for x in b)
+
+            only_in_a = count_a - count_b
+            only_in_b = count_b - count_a
+
+            if only_in_a or only_in_b:
+                differences.append(f"{prefix} list contents differ:")
+                if only_in_a:
+                    differences.append(f"  items only in first:  {sorted(only_in_a.elements())}")
+                if only_in_b:
+                    differences.append(f"  items only in second: {sorted(only_in_b.elements())}")
+
+        elif a != b:
+            differences.append(f"{prefix} value differs:\n    first:  {a}\n    second: {b}")
 
     return differences
 